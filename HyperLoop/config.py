@@ -4,6 +4,8 @@
 # Author: Rob Hickling
 # ===========================
 
+import os
+
 # ---------------------------
 # Run settings
 # ---------------------------
@@ -11,15 +13,45 @@
 # Number of hyperopt loops to complete
 NUM_RUNS = 50
 
+# Number of hyperopt runs to execute concurrently
+# Must stay at 1 for now: every run shares the one strategy JSON used
+# for completion detection, so concurrent runs would claim each other's
+# results. Values above 1 are clamped back to 1 at startup
+MAX_PARALLEL_RUNS = 1
+
 # Hyperopt epochs per run
 EPOCHS = 400
 
 # Hyperopt threads to utilize
 THREADS = 14
 
+# Parameter sets evaluated per optimizer ask/tell cycle. freqtrade's -j
+# flag drives both the worker count and the ask batch size, so this is
+# what actually gets passed as -j; keep it at THREADS unless you want
+# larger batches per surrogate-model fit
+BATCH_SIZE = THREADS
+
 # Number of results to save
 TOP_N = 10
 
+# Epochs a run must complete before it can be early-stopped (0 = never).
+# Once the top-N list is full, a run whose best objective after this many
+# epochs is still worse than the current N-th best (plus the margin) gets
+# terminated instead of running to EPOCHS
+EARLY_STOP_AFTER_EPOCHS = 0
+
+# Slack added to the early-stop cutoff (objective units, lower is better)
+EARLY_STOP_MARGIN = 0.0
+
+# Base random seed; each run passes RANDOM_STATE + run_id to freqtrade so
+# no two runs re-explore the same initial points (0 = let freqtrade pick)
+RANDOM_STATE = 0
+
+# Run hyperopt directly with output piped to the log file instead of
+# opening a terminal window - required on servers/containers without a
+# display, optional elsewhere
+HEADLESS = not os.environ.get("DISPLAY")
+
 # Maximum number of HyperLoop log files to keep (0 = keep all)
 MAX_LOG_FILES = 10
 
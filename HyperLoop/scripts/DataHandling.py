@@ -7,13 +7,67 @@
 # Create results data
 # ===========================
 
+import ast
+import atexit
+import heapq
 import json
+import os
 import re
 import shutil
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+# orjson serializes in C and is noticeably faster than stdlib json;
+# fall back to stdlib on platforms without wheels
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Package root and results directory, resolved once at import
+_HYPERSUITE_ROOT = Path(__file__).resolve().parent.parent
+_RESULTS_DIR = _HYPERSUITE_ROOT / "results"
+
+# Minimum seconds between flushes of the results file
+FLUSH_INTERVAL = 2.0
+
+# Patterns for the best-result metrics line, compiled once at import
+_RE_TRADES = re.compile(r"(\d+)\s+trades")
+_RE_WDL = re.compile(r"(\d+)/(\d+)/(\d+)\s+Wins/Draws/Losses")
+_RE_AVG_PROFIT = re.compile(r"Avg profit\s+([\d.]+)%")
+_RE_MEDIAN_PROFIT = re.compile(r"Median profit\s+([\d.]+)%")
+_RE_TOTAL_PROFIT = re.compile(r"Total profit\s+([\d.]+)\s+USDT")
+_RE_PROFIT_PERCENT = re.compile(r"Total profit\s+[\d.]+\s+USDT\s+\(\s*([\d.]+)%\)")
+_RE_AVG_DURATION = re.compile(r"Avg duration\s+([\d:]+)\s+min")
+_RE_OBJECTIVE = re.compile(r"Objective:\s+([-\d.]+)")
+
+# Patterns for the log-file scan
+_RE_EPOCH = re.compile(r"(\d+)/(\d+):")
+_RE_EPOCH_ROW = re.compile(r"(\d+)/(\d+)")
+_RE_MAX_DD = re.compile(r"Max drawdown\s*:\s*([\d.]+)\s+USDT\s*\(\s*([\d.]+)%\)")
+_RE_MAX_DD_SIMPLE = re.compile(r"Max drawdown\s*[:\s]+([\d.]+)")
+
+# Parameter sections emitted at the end of a hyperopt log
+_PARAM_SECTIONS: dict[str, str] = {
+    "buy_params": "# Buy parameters:",
+    "sell_params": "# Sell parameters:",
+    "protection_params": "# Protection parameters:",
+    "roi_params": "# ROI parameters:",
+    "stoploss_params": "# Stoploss parameters:",
+    "trailing_params": "# Trailing stop parameters:",
+    "max_open_trades": "# Max open trades parameters:",
+}
+
+
+def _heap_sort_key(entry: tuple[float, int, dict[str, Any]]) -> tuple[float, int]:
+    """
+    Order heap entries by ascending objective, then insertion order.
+    """
+
+    return (-entry[0], entry[1])
+
 
 class DataHandling:
     """
@@ -24,8 +78,8 @@ class DataHandling:
         # -------------------------
         # Set paths
         # -------------------------
-        hypersuite_root = Path(__file__).resolve().parent.parent
-        self.results_file = hypersuite_root / "top_results.json"
+        self.results_file = _HYPERSUITE_ROOT / "top_results.json"
+        self.failed_file = _HYPERSUITE_ROOT / "failed_runs.jsonl"
 
         # -------------------------
         # Clean old data
@@ -38,6 +92,29 @@ class DataHandling:
         # -------------------------
         self.data = self.load_data()
 
+        # -------------------------
+        # Top-N bookkeeping
+        # -------------------------
+        # Bounded max-heap of (negated objective, insertion counter, result).
+        # Lower objective is better, so negating the key keeps the current
+        # worst result at the heap root; the counter breaks ties so result
+        # dicts are never compared.
+        self._heap: list[tuple[float, int, dict[str, Any]]] = []
+        self._counter = 0
+        for result in self.data["top_results"]:
+            self._heap.append((-result.get("objective", float("inf")), self._counter, result))
+            self._counter += 1
+        heapq.heapify(self._heap)
+
+        # -------------------------
+        # Write batching
+        # -------------------------
+        # Updates mark the data dirty and only hit disk every FLUSH_INTERVAL
+        # seconds; flush() forces a write and runs again at interpreter exit.
+        self._dirty = False
+        self._last_flush = time.monotonic()
+        atexit.register(self.flush)
+
     # ----------------------------------------------------------------------------------------------
     # Cleanup
 
@@ -50,45 +127,36 @@ class DataHandling:
             self.results_file.unlink()
             print("Removed: Existing top_results.json for clean start")
 
+        if self.failed_file.exists():
+            self.failed_file.unlink()
+            print("Removed: Existing failed_runs.jsonl for clean start")
+
     @staticmethod
     def clear_old_results():
         """
         Ensure the results folder is empty at the start of the script.
         """
 
-        hypersuite_root = Path(__file__).resolve().parent.parent
-        runs_dir = hypersuite_root / "results"
+        runs_dir = _RESULTS_DIR
 
         # Validate path to prevent directory traversal
-        if not runs_dir.is_relative_to(hypersuite_root):
+        if not runs_dir.is_relative_to(_HYPERSUITE_ROOT):
             raise RuntimeError(f"Invalid results directory path: {runs_dir}")
 
         if runs_dir.exists():
-            # Count items before deletion
-            items = list(runs_dir.iterdir())
-            if items:
-                try:
-                    # Remove all contents with safety checks
-                    for item in runs_dir.iterdir():
-                        # Sanity check: ensure we're only deleting within the expected directory
-                        if not item.is_relative_to(runs_dir):
-                            print(f"Warning: Skipping unsafe path: {item}")
-                            continue
-
-                        if item.is_file():
-                            item.unlink()
-                        elif item.is_dir():
-                            shutil.rmtree(item)
-                    print(f"Removed: {len(items)} item from Results folder")
-                except OSError as e:
-                    print(f"Warning: Could not clear results folder: {e}")
-            else:
-                print("Warning: Results folder is already empty")
+            # Remove the whole tree in one call instead of stat-ing and
+            # deleting every entry individually
+            try:
+                shutil.rmtree(runs_dir)
+                print("Removed: Old contents of Results folder")
+            except OSError as e:
+                print(f"Warning: Could not clear results folder: {e}")
         else:
-            # Create the directory if it doesn't exist
-            runs_dir.mkdir(parents=True, exist_ok=True)
             print("Created: Results folder")
 
+        # Recreate the empty directory
+        runs_dir.mkdir(parents=True, exist_ok=True)
+
     # ----------------------------------------------------------------------------------------------
     # Utilities
 
@@ -97,23 +165,52 @@ class DataHandling:
         Save current data to file.
         """
 
+        # Materialize the sorted top results only at write time
+        self.data["top_results"] = self.get_top_results()
+
         try:
-            with self.results_file.open("w") as f:
-                json.dump(self.data, f, indent=2)
+            # Write to a temp file and rename so the results file is
+            # never left half-written
+            tmp_file = self.results_file.with_suffix(".json.tmp")
+            if orjson is not None:
+                tmp_file.write_bytes(orjson.dumps(self.data, option=orjson.OPT_INDENT_2))
+            else:
+                with tmp_file.open("w") as f:
+                    json.dump(self.data, f, indent=2)
+            os.replace(tmp_file, self.results_file)
         except OSError as e:
             print(f"Warning: Could not save data: {e}")
 
+        self._dirty = False
+        self._last_flush = time.monotonic()
+
+    def flush(self) -> None:
+        """
+        Write any pending changes to disk immediately.
+        """
+
+        if self._dirty:
+            self.save_data()
+
+    def _maybe_flush(self) -> None:
+        """
+        Flush pending changes once the flush interval has elapsed.
+        """
+
+        if self._dirty and (time.monotonic() - self._last_flush) > FLUSH_INTERVAL:
+            self.save_data()
+
     def load_data(self) -> dict[str, Any]:
         """Load existing data or create new."""
         if self.results_file.exists():
             try:
-                return json.loads(self.results_file.read_text())
-            except (OSError, json.JSONDecodeError):
+                raw = self.results_file.read_bytes()
+                return orjson.loads(raw) if orjson is not None else json.loads(raw)
+            except (OSError, ValueError):
                 pass
 
         return {
             "top_results": [],
-            "failed_runs": [],
         }
 
     def add_result(self, result: dict[str, Any], top_n: int) -> None:
@@ -121,29 +218,33 @@ class DataHandling:
         Add a new result and update top N.
         """
 
-        self.data["top_results"] = self.update_top_results(result, top_n)
-        self.save_data()
+        self.update_top_results(result, top_n)
+        self._dirty = True
+        self._maybe_flush()
 
     def update_top_results(self, new_result: dict[str, Any], top_n: int) -> list[dict[str, Any]]:
         """
         Update top N results with new result.
         """
 
-        top_results = self.data["top_results"].copy()
+        objective = new_result.get("objective", float("inf"))
+
+        # The heap root holds the current worst retained result, so a full
+        # heap can reject non-improving results in constant time without
+        # building an entry - this stays cheap however large top_n grows
+        if len(self._heap) >= top_n and -objective <= self._heap[0][0]:
+            return self.get_top_results()
 
-        if len(top_results) < top_n:
-            top_results.append(new_result)
+        entry = (-objective, self._counter, new_result)
+        self._counter += 1
+
+        if len(self._heap) < top_n:
+            heapq.heappush(self._heap, entry)
         else:
-            worst_result = max(top_results, key=lambda x: x.get("objective", float("inf")))
-            if new_result.get("objective", float("inf")) < worst_result.get(
-                "objective", float("inf")
-            ):
-                top_results.remove(worst_result)
-                top_results.append(new_result)
+            # Replaces the current worst result with the better new one
+            heapq.heappushpop(self._heap, entry)
 
-        # Sort by objective (ascending - lower is better in hyperopt)
-        top_results.sort(key=lambda x: x.get("objective", float("inf")))
-        return top_results
+        return self.get_top_results()
 
     def record_failure(self, run_id: int, error: Exception):
         """
@@ -156,15 +257,41 @@ class DataHandling:
             "error": str(error),
             "error_type": type(error).__name__,
         }
-        self.data["failed_runs"].append(failure_data)
-        self.save_data()
+
+        # Append one line per failure so the cost stays constant instead of
+        # rewriting a growing results document
+        if orjson is not None:
+            line = orjson.dumps(failure_data).decode()
+        else:
+            line = json.dumps(failure_data)
+
+        try:
+            with self.failed_file.open("a") as f:
+                f.write(line + "\n")
+        except OSError as e:
+            print(f"Warning: Could not record failure: {e}")
+
+    def iter_failures(self):
+        """
+        Yield recorded failures from the failed-runs sidecar.
+        """
+
+        if not self.failed_file.exists():
+            return
+
+        with self.failed_file.open("r") as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    yield orjson.loads(line) if orjson is not None else json.loads(line)
 
     def get_top_results(self) -> list[dict[str, Any]]:
         """
         Get current top results.
         """
 
-        return self.data["top_results"]
+        # Sort by objective (ascending - lower is better in hyperopt)
+        return [result for _, _, result in sorted(self._heap, key=_heap_sort_key)]
 
     def extract_data(self, run_dir: Path) -> dict[str, Any]:
         """
@@ -175,17 +302,8 @@ class DataHandling:
         if not log_file.exists():
             raise RuntimeError(f"hyperopt.log not found in {run_dir}")
 
-        # Read log content
-        content = log_file.read_text()
-
-        # Check if hyperopt completed but found no good results
-        if "Best result:" not in content:
-            raise RuntimeError(
-                "Hyperopt completed but found no good results (no Best result section)"
-            )
-
-        # Parse content
-        return self.parse_log_file(content, run_dir)
+        # Parse the log in a single streaming pass
+        return self.parse_log_file(log_file, run_dir)
 
     @staticmethod
     def copy_hyperopt_results(strat_name: str, strategies_dir: Path, run_dir: Path) -> None:
@@ -210,21 +328,110 @@ class DataHandling:
     # ----------------------------------------------------------------------------------------------
     # Main Methods
 
-    def parse_log_file(self, content: str, run_dir: Path) -> dict[str, Any]:
+    def parse_log_file(self, log_file: Path, run_dir: Path) -> dict[str, Any]:
         """
-        Parse log content string for results.
+        Parse a hyperopt log file for results in a single streaming pass.
         """
 
-        lines = content.split("\n")
-
-        # Find the Best result line and extract the data line (2 lines after)
+        # State for the Best result data line (2 lines after the header)
+        saw_best = False
+        best_countdown = 0
         best_result_line = None
-        for i, line in enumerate(lines):
-            if "Best result:" in line:
-                # Skip the empty line and get the data line
-                if i + 2 < len(lines):
-                    best_result_line = lines[i + 2]
-                break
+        epoch_match = None
+
+        # Epoch-table rows keyed by their "epoch/total" fraction, so the
+        # max-drawdown row can be resolved once the best epoch is known
+        epoch_rows: dict[str, str] = {}
+        needle = None
+        found_line = None
+
+        # First fallback max-drawdown matches seen anywhere in the log
+        max_dd_match = None
+        max_dd_match2 = None
+
+        # Parameter-section state machine
+        params: dict[str, Any] = {}
+        done_sections: set[str] = set()
+        current_section = None
+        param_text: list[str] = []
+
+        with log_file.open("r") as f:
+            for line in f:
+                line = line.rstrip("\n")
+
+                # Locate the Best result data line
+                if best_result_line is None:
+                    if best_countdown > 0:
+                        best_countdown -= 1
+                        if best_countdown == 0:
+                            best_result_line = line
+                            # Resolve the best epoch's table row right away;
+                            # the table precedes the summary, so the row is
+                            # already collected if it exists
+                            epoch_match = _RE_EPOCH.search(line)
+                            if epoch_match:
+                                needle = f"{epoch_match.group(1)}/{epoch_match.group(2)}"
+                                found_line = epoch_rows.get(needle)
+                                # The row bookkeeping is no longer needed
+                                epoch_rows.clear()
+                    elif "Best result:" in line:
+                        saw_best = True
+                        best_countdown = 2
+
+                # Remember the first table row for each epoch, until the
+                # best row has been resolved
+                if found_line is None and "│" in line:
+                    row_match = _RE_EPOCH_ROW.search(line)
+                    if row_match:
+                        epoch_rows.setdefault(row_match.group(0), line)
+
+                # Accumulate fallback max-drawdown matches while streaming;
+                # once the epoch row is known the fallback can't be used
+                if needle is None and "Max drawdown" in line:
+                    if max_dd_match is None:
+                        max_dd_match = _RE_MAX_DD.search(line)
+                    if max_dd_match2 is None:
+                        max_dd_match2 = _RE_MAX_DD_SIMPLE.search(line)
+
+                # Parameter sections
+                if current_section is None:
+                    # Only lines containing '#' can open a section, so skip
+                    # the header scan for everything else
+                    if "#" in line:
+                        for param_type, section_header in _PARAM_SECTIONS.items():
+                            if param_type in done_sections or section_header not in line:
+                                continue
+                            # Special filter for ROI parameters - skip if loaded from strategy
+                            if param_type == "roi_params" and "# value loaded from strategy" in line:
+                                done_sections.add(param_type)
+                                break
+                            current_section = param_type
+                            param_text = []
+                            break
+                elif f"{current_section} = {{" in line:
+                    # Start collecting params - include this line's content after the brace
+                    params_start = line.find("{") + 1
+                    if params_start > 0:
+                        param_text.append(line[params_start:])
+                elif "}" in line:
+                    # End of params - include content before the closing brace
+                    params_end = line.find("}")
+                    if params_end > 0:
+                        param_text.append(line[:params_end])
+                    # Join all collected text and parse
+                    full_param_text = "".join(param_text)
+                    if full_param_text.strip():
+                        params[current_section] = self.parse_parameters(full_param_text)
+                    done_sections.add(current_section)
+                    current_section = None
+                elif "#" not in line:  # Only collect lines without #
+                    param_text.append(line)
+
+        # Check if hyperopt completed but found no good results
+        if not saw_best:
+            raise RuntimeError(
+                "Hyperopt completed but found no good results (no Best result section)"
+            )
 
         if not best_result_line:
             raise RuntimeError("Could not find Best result data line")
@@ -232,19 +439,11 @@ class DataHandling:
         # Parse the metrics from the single data line
         metrics = self.parse_result_data(best_result_line)
 
-        # Extract epoch number from best result line to find the corresponding max drawdown line
-        epoch_match = re.search(r"(\d+)/\d+:", best_result_line)
+        # The best epoch's table row carries the max drawdown
         if epoch_match:
-            epoch_num = epoch_match.group(1)
-
-            # Search for the line containing this epoch number in the table
-            found_line = None
-            for line in lines:
-                # Look for the pattern: │ Best │ 69/100 │ (or just the epoch number in table)
-                if f"{epoch_num}/100" in line and "│" in line:
-                    found_line = line
-                    break
-
+            if found_line is None:
+                # Covers the unusual case of a row printed after the summary
+                found_line = epoch_rows.get(needle)
             if found_line:
                 # Split by │ and get the 9th column (index 8) for max drawdown
                 columns = found_line.split("│")
@@ -255,67 +454,11 @@ class DataHandling:
                         max_dd_column = "0.000 USDT (0.00%)"
                     if max_dd_column:
                         metrics["max_drawdown"] = max_dd_column
-        else:
-            # Fallback: Search entire content for max drawdown patterns
-            max_dd_match = re.search(
-                r"Max drawdown\s*:\s*([\d.]+)\s+USDT\s*\(\s*([\d.]+)%\)", content
-            )
-            if max_dd_match:
-                metrics["max_drawdown"] = f"{max_dd_match.group(1)} USDT ({max_dd_match.group(2)}%)"
-            else:
-                # Pattern 2: Just look for "Max drawdown" followed by numbers
-                max_dd_match2 = re.search(r"Max drawdown\s*[:\s]+([\d.]+)", content)
-                if max_dd_match2:
-                    metrics["max_drawdown"] = max_dd_match2.group(1)
-
-        # Parse parameters (look for all parameter sections)
-        params = {}
-        param_sections = {
-            "buy_params": "# Buy parameters:",
-            "sell_params": "# Sell parameters:",
-            "protection_params": "# Protection parameters:",
-            "roi_params": "# ROI parameters:",
-            "stoploss_params": "# Stoploss parameters:",
-            "trailing_params": "# Trailing stop parameters:",
-            "max_open_trades": "# Max open trades parameters:",
-        }
-
-        for param_type, section_header in param_sections.items():
-            in_section = False
-            param_text = []
-
-            for line in lines:
-                if section_header in line:
-                    # Special filter for ROI parameters - skip if loaded from strategy
-                    if param_type == "roi_params" and "# value loaded from strategy" in line:
-                        # print(f"Skipping '{param_type}' - loaded from strategy: {line}")
-                        break
-                    # print(f"Found '{param_type}' section at line: {line}")
-                    # print(f"Section header matched: '{section_header}' in '{line}'")
-                    in_section = True
-                    continue
-
-                if in_section:
-                    if f"{param_type} = {{" in line:
-                        # print(f"Found '{param_type}' start: {line}")
-                        # Start collecting params - include this line's content after the brace
-                        params_start = line.find("{") + 1
-                        if params_start > 0:
-                            param_text.append(line[params_start:])
-                        continue
-                    elif "}" in line:
-                        # End of params - include content before the closing brace
-                        params_end = line.find("}")
-                        if params_end > 0:
-                            param_text.append(line[:params_end])
-                        # Join all collected text and parse
-                        full_param_text = "".join(param_text)
-                        if full_param_text.strip():
-                            parsed_params = self.parse_parameters(full_param_text)
-                            params[param_type] = parsed_params
-                        break
-                    elif "#" not in line:  # Only collect lines without #
-                        param_text.append(line)
+        elif max_dd_match:
+            metrics["max_drawdown"] = f"{max_dd_match.group(1)} USDT ({max_dd_match.group(2)}%)"
+        elif max_dd_match2:
+            # Pattern 2: Just "Max drawdown" followed by numbers
+            metrics["max_drawdown"] = max_dd_match2.group(1)
 
         return {
             "run": run_dir.name,
@@ -335,12 +478,12 @@ class DataHandling:
         metrics = {}
 
         # Extract trades
-        trades_match = re.search(r"(\d+)\s+trades", best_result_line)
+        trades_match = _RE_TRADES.search(best_result_line)
         if trades_match:
             metrics["total_trades"] = int(trades_match.group(1))
 
         # Extract wins/draws/losses
-        wdl_match = re.search(r"(\d+)/(\d+)/(\d+)\s+Wins/Draws/Losses", best_result_line)
+        wdl_match = _RE_WDL.search(best_result_line)
         if wdl_match:
             wins, draws, losses = map(int, wdl_match.groups())
             metrics["wins_draws_losses"] = f"{wins}/{draws}/{losses}"
@@ -348,34 +491,32 @@ class DataHandling:
             metrics["win_rate"] = wins / total if total > 0 else 0
 
         # Extract average profit
-        avg_profit_match = re.search(r"Avg profit\s+([\d.]+)%", best_result_line)
+        avg_profit_match = _RE_AVG_PROFIT.search(best_result_line)
         if avg_profit_match:
             metrics["avg_profit"] = float(avg_profit_match.group(1))
 
         # Extract median profit
-        median_profit_match = re.search(r"Median profit\s+([\d.]+)%", best_result_line)
+        median_profit_match = _RE_MEDIAN_PROFIT.search(best_result_line)
         if median_profit_match:
             metrics["median_profit"] = float(median_profit_match.group(1))
 
         # Extract total profit (USDT amount)
-        total_profit_match = re.search(r"Total profit\s+([\d.]+)\s+USDT", best_result_line)
+        total_profit_match = _RE_TOTAL_PROFIT.search(best_result_line)
         if total_profit_match:
             metrics["total_profit"] = float(total_profit_match.group(1))
 
         # Extract profit percentage
-        profit_percent_match = re.search(
-            r"Total profit\s+[\d.]+\s+USDT\s+\(\s*([\d.]+)%\)", best_result_line
-        )
+        profit_percent_match = _RE_PROFIT_PERCENT.search(best_result_line)
         if profit_percent_match:
             metrics["profit_percent"] = float(profit_percent_match.group(1))
 
         # Extract average duration
-        avg_duration_match = re.search(r"Avg duration\s+([\d:]+)\s+min", best_result_line)
+        avg_duration_match = _RE_AVG_DURATION.search(best_result_line)
         if avg_duration_match:
             metrics["avg_duration"] = avg_duration_match.group(1)
 
         # Extract objective
-        objective_match = re.search(r"Objective:\s+([-\d.]+)", best_result_line)
+        objective_match = _RE_OBJECTIVE.search(best_result_line)
         if objective_match:
             metrics["objective"] = float(objective_match.group(1))
 
@@ -387,52 +528,19 @@ class DataHandling:
         Parse parameters from text.
         """
 
-        # Handle JSON format parameters
+        # The sections are Python source emitted by freqtrade, so
+        # ast.literal_eval accepts the dialect directly (single quotes,
+        # trailing commas, True/False/None) with no regex clean-up; it is
+        # also newline-tolerant inside the braces, which covers the
+        # multi-line ROI dict
         try:
-            # Clean up JSON text - join all lines and clean
-            cleaned_text = params_text.strip()
-
-            # For ROI parameters, handle multi-line JSON specially
-            if "minimal_roi" in cleaned_text:
-                # Extract the JSON part more carefully for ROI
-                lines = cleaned_text.split("\n")
-                json_lines = []
-                in_json = False
-
-                for line in lines:
-                    line = line.strip()
-                    if "{" in line:
-                        in_json = True
-                        json_lines.append(line)
-                    elif in_json:
-                        json_lines.append(line)
-                        if "}" in line:
-                            break
-
-                cleaned_text = "\n".join(json_lines)
-            else:
-                # For other parameters, remove whitespace between parameters
-                cleaned_text = re.sub(r"\s+", " ", cleaned_text)
-                # Remove trailing commas before closing braces
-                cleaned_text = re.sub(r",(\s*})", r"\1", cleaned_text)
-                # Remove trailing comma at the very end if it exists
-                cleaned_text = re.sub(r",\s*$", "", cleaned_text)
-                # Ensure proper JSON structure
-                if not cleaned_text.startswith("{"):
-                    cleaned_text = "{" + cleaned_text
-                if not cleaned_text.endswith("}"):
-                    cleaned_text = cleaned_text + "}"
-
-            # Try to parse as JSON
-            params = json.loads(cleaned_text)
-            return params
-
-        except (json.JSONDecodeError, Exception) as e:
-            print(f"JSON parsing failed: {e}")
+            return ast.literal_eval("{" + params_text.strip().rstrip(",") + "}")
+        except (SyntaxError, ValueError) as e:
+            print(f"Parameter parsing failed: {e}")
             print(f"Original text: {params_text[:200]}...")
             # Fallback to line-by-line parsing
             params = {}
-            for line in params_text.split("\n"):
+            for line in params_text.splitlines():
                 line = line.strip()
                 if not line or "#" in line or ":" not in line:
                     continue
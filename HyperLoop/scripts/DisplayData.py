@@ -7,8 +7,20 @@
 # ===========================
 
 import json
+import sys
 from typing import Any
 
+# orjson formats in C when available; fall back to stdlib json otherwise
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Progress bar templates, sliced per call instead of rebuilding the strings
+_BAR_LENGTH = 50
+_BAR_FULL = "█" * _BAR_LENGTH
+_BAR_EMPTY = "░" * _BAR_LENGTH
+
 
 class DisplayData:
     """
@@ -25,12 +37,14 @@ class DisplayData:
         """
 
         percent = (current / total) * 100
-        bar_length = 50
-        filled = int(bar_length * current // total)
-        bar = "█" * filled + "░" * (bar_length - filled)
+        filled = _BAR_LENGTH * current // total
+        bar = _BAR_FULL[:filled] + _BAR_EMPTY[filled:]
 
-        print(" -  Current Progress  -")
-        print(f"\r[{bar}] {percent:.1f}% ({current}/{total})", end="", flush=True)
+        # Print the header once, not on every update
+        if current == 1:
+            sys.stdout.write(" -  Current Progress  -\n")
+        sys.stdout.write(f"\r[{bar}] {percent:.1f}% ({current}/{total})")
+        sys.stdout.flush()
 
     @staticmethod
     def display_top_results(top_results: list[dict[str, Any]]) -> None:
@@ -38,18 +52,26 @@ class DisplayData:
         Display current top results.
         """
 
-        print(f"\nTOP {len(top_results)} HYPEROPT RESULTS")
-        print(f"{'=' * 60}")
+        # Accumulate the whole report and write it in one go
+        out = [
+            f"\nTOP {len(top_results)} HYPEROPT RESULTS",
+            f"{'=' * 60}",
+        ]
 
         for i, r in enumerate(top_results, start=1):
-            print(f"#{i} — {r['run']}")
-            print(f"  Objective   : {r.get('objective', 'N/A')}")
-            print(f"  Total Trades: {r.get('metrics', {}).get('total_trades', 'N/A')}")
-            print(f"  Total Profit: {r['profit']:.2f}")
-            print(f"  Avg Profit  : {r.get('metrics', {}).get('avg_profit', 'N/A')}")
-            print("\n  Parameters:")
-            print(json.dumps(r["params"], indent=4))
-            print("-" * 60)
+            out.append(f"#{i} — {r['run']}")
+            out.append(f"  Objective   : {r.get('objective', 'N/A')}")
+            out.append(f"  Total Trades: {r.get('metrics', {}).get('total_trades', 'N/A')}")
+            out.append(f"  Total Profit: {r['profit']:.2f}")
+            out.append(f"  Avg Profit  : {r.get('metrics', {}).get('avg_profit', 'N/A')}")
+            out.append("\n  Parameters:")
+            if orjson is not None:
+                out.append(orjson.dumps(r["params"], option=orjson.OPT_INDENT_2).decode())
+            else:
+                out.append(json.dumps(r["params"], indent=4))
+            out.append("-" * 60)
+
+        sys.stdout.write("\n".join(out) + "\n")
 
         # Display results table
         DisplayData.display_results_table(top_results)
@@ -63,7 +85,7 @@ class DisplayData:
         if not results:
             return
 
-        print(f"\n{' ' * 50}HYPEROPT RESULTS TABLE{' ' * 50}")
+        out = [f"\n{' ' * 50}HYPEROPT RESULTS TABLE{' ' * 50}"]
 
         # Define table headers
         headers = [
@@ -77,9 +99,6 @@ class DisplayData:
             "Max Drawdown",
         ]
 
-        # Calculate column widths
-        col_widths = [len(header) for header in headers]
-
         # Prepare table data
         table_data = []
         for i, result in enumerate(results, start=1):
@@ -150,26 +169,27 @@ class DisplayData:
             ]
             table_data.append(row)
 
-            # Update column widths based on data
-            for j, cell in enumerate(row):
-                if len(str(cell)) > col_widths[j]:
-                    col_widths[j] = len(str(cell))
+        # Calculate column widths in one pass over the finished rows
+        col_widths = [
+            max(len(header), *(len(row[i]) for row in table_data))
+            for i, header in enumerate(headers)
+        ]
+
+        # Horizontal border segments, built once and reused for all borders
+        segments = ["━" * (width + 2) for width in col_widths]
 
         # Build results table
         # Top border
-        top_border = "┏" + "┳".join("━" * (width + 2) for width in col_widths) + "┓"
-        print(top_border)
+        out.append("┏" + "┳".join(segments) + "┓")
 
         # Header row
         header_cells = []
         for i, header in enumerate(headers):
             header_cells.append(f" {header:^{col_widths[i]}} ")
-        header_row = "┃" + "┃".join(header_cells) + "┃"
-        print(header_row)
+        out.append("┃" + "┃".join(header_cells) + "┃")
 
         # Separator
-        separator = "┡" + "╇".join("━" * (width + 2) for width in col_widths) + "┩"
-        print(separator)
+        out.append("┡" + "╇".join(segments) + "┩")
 
         # Data rows
         for row in table_data:
@@ -191,9 +211,10 @@ class DisplayData:
                 else:  # Other columns - left align
                     cell_str = f" {str(cell):<{col_widths[i]}} "
                 row_cells.append(cell_str)
-            data_row = "┃" + "┃".join(row_cells) + "┃"
-            print(data_row)
+            out.append("┃" + "┃".join(row_cells) + "┃")
 
         # Bottom border
-        bottom_border = "┗" + "┷".join("━" * (width + 2) for width in col_widths) + "┛"
-        print(bottom_border)
+        out.append("┗" + "┷".join(segments) + "┛")
+
+        # Emit the whole table with a single write
+        sys.stdout.write("\n".join(out) + "\n")
@@ -7,10 +7,13 @@
 # ===========================
 
 import json
+import re
 import shutil
 import subprocess
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
@@ -18,11 +21,32 @@ from typing import Optional
 # Required for viewing current processes
 import psutil
 
+# orjson serializes in C when available; fall back to stdlib json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# inotify (Linux) turns completion detection into kernel events;
+# fall back to polling when the package is unavailable
+try:
+    from inotify_simple import INotify
+    from inotify_simple import flags as inotify_flags
+except ImportError:
+    INotify = None
+    inotify_flags = None
+
 from HyperLoop.config import (
+    BATCH_SIZE,
     CONFIG_NAME,
+    EARLY_STOP_AFTER_EPOCHS,
+    EARLY_STOP_MARGIN,
     EPOCHS,
+    HEADLESS,
     HYPEROPT_LOSS,
+    MAX_PARALLEL_RUNS,
     NUM_RUNS,
+    RANDOM_STATE,
     SPACES,
     STRAT_NAME,
     THREADS,
@@ -36,9 +60,13 @@ from HyperLoop.scripts.TerminalManager import TerminalManager
 
 
 # Constants for timing
-CHECK_INTERVAL = 15  # Check every 15 seconds
+CHECK_INTERVAL = 15  # Liveness / early-stop check every 15 seconds
+POLL_INTERVAL = 0.5  # Existence poll cadence when inotify is unavailable
 MIN_WAIT_BEFORE_PROCESS_CHECK = 60  # Don't check processes for first minute
 
+# Epoch progress lines in the hyperopt log ("  12/400: ... Objective: -1.23")
+_RE_EPOCH_PROGRESS = re.compile(r"(\d+)/\d+:.*Objective:\s+([-\d.]+)")
+
 
 class HyperLoop:
     def __init__(self):
@@ -53,8 +81,26 @@ class HyperLoop:
         self.spaces = SPACES
         self.epochs = EPOCHS
         self.threads = THREADS
+        self.batch_size = BATCH_SIZE
         self.num_runs = NUM_RUNS
         self.top_n = TOP_N
+        self.max_parallel_runs = MAX_PARALLEL_RUNS
+        if self.max_parallel_runs > 1:
+            # Completion detection watches the single strategy JSON that
+            # freqtrade writes for STRAT_NAME, so concurrent runs would all
+            # see the first finisher's file and mis-attribute its results.
+            # Refuse to run in that state rather than corrupt the data
+            print(
+                f"MAX_PARALLEL_RUNS={self.max_parallel_runs} is not supported: "
+                "runs share one strategy JSON for completion detection. "
+                "Running sequentially.",
+                flush=True,
+            )
+            self.max_parallel_runs = 1
+        self.early_stop_after_epochs = EARLY_STOP_AFTER_EPOCHS
+        self.early_stop_margin = EARLY_STOP_MARGIN
+        self.random_state = RANDOM_STATE
+        self.headless = HEADLESS
 
         # -------------------------
         # Set paths
@@ -73,12 +119,45 @@ class HyperLoop:
         # -------------------------
         self.data = DataHandling()
 
+        # Guards top-N updates when runs complete concurrently
+        self._results_lock = threading.Lock()
+
         # -------------------------
         # Find freqtrade
         # -------------------------
         self.freqtrade_bin = self.find_freqtrade()
         print(f"\nFound! Freqtrade location: {self.freqtrade_bin}\n")
 
+        # -------------------------
+        # Precompute run invariants
+        # -------------------------
+        # Everything in the hyperopt argv except the per-run seed is fixed
+        # for the life of the suite, so build it once
+        self._hyperopt_cmd = (
+            self.freqtrade_bin,
+            "hyperopt",
+            "--config",
+            str(self.config_path),
+            "--hyperopt-loss",
+            self.hyperopt_loss,
+            "--strategy",
+            self.strat_name,
+            "--timerange",
+            self.timerange,
+            "--timeframe-detail",
+            self.timeframe_detail,
+            "--spaces",
+            self.spaces,
+            "--epochs",
+            str(self.epochs),
+            "-j",
+            # -j is also the optimizer's ask batch size, so BATCH_SIZE is
+            # what freqtrade evaluates per surrogate-model fit
+            str(self.batch_size),
+            "--print-all",
+        )
+        self._project_root_str = str(self.project_root)
+
     # ----------------------------------------------------------------------------------------------
     # Utilities
 
@@ -90,49 +169,41 @@ class HyperLoop:
         # Find current strategy JSON file
         strategy_json = self.strategies_dir / f"{self.strat_name}.json"
 
-        # Remove existing strategy JSON file
-        if strategy_json.exists():
+        # Remove existing strategy JSON file - unlinking directly is one
+        # syscall instead of stat-then-unlink and closes the TOCTOU window
+        try:
             strategy_json.unlink()
             print(f"Removed existing strategy JSON: {strategy_json.name}")
+        except FileNotFoundError:
+            pass
 
-        # Clean up run directory if it exists
-        if run_dir.exists():
-            run_dir_strategy_json = run_dir / f"{self.strat_name}.json"
-            if run_dir_strategy_json.exists():
-                run_dir_strategy_json.unlink()
-                print(f"Removed strategy JSON from run directory: {run_dir_strategy_json.name}")
+        # Clean up run directory copy the same way
+        run_dir_strategy_json = run_dir / f"{self.strat_name}.json"
+        try:
+            run_dir_strategy_json.unlink()
+            print(f"Removed strategy JSON from run directory: {run_dir_strategy_json.name}")
+        except FileNotFoundError:
+            pass
 
         return strategy_json, None
 
-    def build_hyperopt_cmd(self) -> list[str]:
+    def build_hyperopt_cmd(self, run_id: int = 0) -> list[str]:
         """
         Build the hyperopt command.
         """
 
-        return [
-            self.freqtrade_bin,
-            "hyperopt",
-            "--config",
-            str(self.config_path),
-            "--hyperopt-loss",
-            self.hyperopt_loss,
-            "--strategy",
-            self.strat_name,
-            "--timerange",
-            self.timerange,
-            "--timeframe-detail",
-            self.timeframe_detail,
-            "--spaces",
-            self.spaces,
-            "--epochs",
-            str(self.epochs),
-            "-j",
-            str(self.threads),
-            "--print-all",
-        ]
+        cmd = list(self._hyperopt_cmd)
 
-    @staticmethod
-    def wait_for_hyperopt_completion(run_dir: Path, strategy_json: Path) -> Optional[Path]:
+        # Seed each run differently so no two runs start from the same
+        # random initial points
+        if self.random_state:
+            cmd += ["--random-state", str(self.random_state + run_id)]
+
+        return cmd
+
+    def wait_for_hyperopt_completion(
+        self, run_dir: Path, strategy_json: Path, proc: Optional[subprocess.Popen] = None
+    ) -> Optional[Path]:
         """
         Wait for hyperopt completion by monitoring strategy JSON file.
         """
@@ -140,57 +211,214 @@ class HyperLoop:
         print("Waiting for hyperopt to complete...\n", flush=True)
 
         # Variables
-        check_interval = CHECK_INTERVAL
-        min_wait_before_process_check = MIN_WAIT_BEFORE_PROCESS_CHECK
         start_time = time.time()
 
-        # Check if JSON file exists with retry mechanism
-        while True:
-            max_retries = 3
-            for attempt in range(max_retries):
+        # PID written by the terminal wrapper, read once when needed
+        pid_file = run_dir / "hyperopt.pid"
+        wrapper_pid = None
+
+        # Early-stop bookkeeping: incremental log offset and the best
+        # objective / highest epoch seen so far in this run
+        log_file = run_dir / "hyperopt.log"
+        log_pos = 0
+        run_best = float("inf")
+        max_epoch = 0
+
+        # Kernel-driven watch on the strategies folder; events replace the
+        # existence-polling loop when inotify is available
+        inot = None
+        if INotify is not None:
+            try:
+                inot = INotify()
+                # Only close-after-write and rename-into-place prove the
+                # file is complete - CREATE fires on open-for-write, while
+                # the writer is still mid-write
+                inot.add_watch(
+                    str(strategy_json.parent),
+                    inotify_flags.CLOSE_WRITE | inotify_flags.MOVED_TO,
+                )
+            except OSError:
+                inot = None
+
+        # True once a CLOSE_WRITE/MOVED_TO event proved the JSON complete
+        json_closed = False
+
+        try:
+            while True:
                 if strategy_json.exists():
-                    # Double-check file exists and is readable
+                    if not json_closed:
+                        # Existence observed by polling, not by a close
+                        # event - the writer may still be mid-write, so
+                        # wait for the file's size to settle first
+                        self._wait_for_write_settle(strategy_json)
+                    print(f"Hyperopt completed - {strategy_json.name} found\n")
+                    print("Post-processing...")
+                    # tee in the terminal wrapper can still be draining the
+                    # tail of hyperopt.log - give it a moment before the
+                    # log is parsed
+                    time.sleep(2)
+                    return run_dir
+
+                # Sleep until the strategy JSON is written, or at most
+                # CHECK_INTERVAL before re-checking liveness
+                if inot is not None:
+                    for event in inot.read(timeout=CHECK_INTERVAL * 1000):
+                        if event.name == strategy_json.name and event.mask & (
+                            inotify_flags.CLOSE_WRITE | inotify_flags.MOVED_TO
+                        ):
+                            json_closed = True
+                            break
+                else:
+                    # Poll existence frequently so completion is noticed
+                    # within POLL_INTERVAL; the liveness and early-stop
+                    # checks below still run only every CHECK_INTERVAL
+                    deadline = time.time() + CHECK_INTERVAL
+                    while time.time() < deadline and not strategy_json.exists():
+                        time.sleep(POLL_INTERVAL)
+
+                # The wait phase saw the JSON (close event or existence
+                # poll) - take the success path at the top of the loop
+                # instead of falling into the liveness checks, which would
+                # misread an already-exited freqtrade as a failed run
+                if json_closed or strategy_json.exists():
+                    continue
+
+                # Early-stop: once enough epochs are in, terminate runs whose
+                # best objective can't crack the current top N
+                if self.early_stop_after_epochs > 0:
+                    run_best, max_epoch, log_pos = self._scan_log_progress(
+                        log_file, log_pos, run_best, max_epoch
+                    )
+                    if max_epoch >= self.early_stop_after_epochs:
+                        with self._results_lock:
+                            top_results = self.data.get_top_results()
+                        if len(top_results) >= self.top_n:
+                            cutoff = top_results[-1].get("objective", float("inf"))
+                            if run_best > cutoff + self.early_stop_margin:
+                                print(
+                                    f"Early-stopping run after {max_epoch} epochs: "
+                                    f"best objective {run_best:.5f} is worse than "
+                                    f"the top-{self.top_n} cutoff {cutoff:.5f}",
+                                    flush=True,
+                                )
+                                (run_dir / "EARLY_STOPPED").write_text(
+                                    f"epochs={max_epoch} best={run_best} cutoff={cutoff}\n"
+                                )
+                                self._terminate_run(proc, wrapper_pid, pid_file)
+                                # Return the run dir so callers can tell an
+                                # intentional early stop (EARLY_STOPPED
+                                # marker present) apart from a failure
+                                return run_dir
+
+                # Check whether hyperopt is still running - the Popen handle
+                # answers in O(1); terminal wrappers detach from their child,
+                # so check the wrapper PID recorded by TerminalManager next
+                hyperopt_running = proc is not None and proc.poll() is None
+
+                if not hyperopt_running:
+                    if wrapper_pid is None and pid_file.exists():
+                        try:
+                            wrapper_pid = int(pid_file.read_text().strip())
+                        except (OSError, ValueError):
+                            wrapper_pid = None
+                    if wrapper_pid is not None:
+                        hyperopt_running = psutil.pid_exists(wrapper_pid)
+
+                # Last resort: scan for a freqtrade hyperopt process, only
+                # materializing the pid and reading cmdlines lazily
+                if not hyperopt_running and wrapper_pid is None:
                     try:
-                        with strategy_json.open("r") as f:
-                            f.read(1)  # Test if file is readable
-                        print(f"Hyperopt completed - {strategy_json.name} found\n")
-                        print("Post-processing...")
-                        time.sleep(2)  # Give it a moment to fully write files
-                        return run_dir
-                    except OSError:
-                        if attempt < max_retries - 1:
-                            time.sleep(1)
-                            continue
-                        else:
-                            raise RuntimeError(
-                                f"Strategy JSON file found but not readable: {strategy_json}"
-                            )
-                time.sleep(0.5)
-
-            # Check if any hyperopt processes are running
-            hyperopt_running = False
+                        for p in psutil.process_iter(["pid"]):
+                            try:
+                                cmdline = " ".join(p.cmdline())
+                                if "freqtrade" in cmdline and "hyperopt" in cmdline:
+                                    hyperopt_running = True
+                                    break
+                            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                                continue
+                    except Exception as e:
+                        # If psutil fails, log the error and continue waiting
+                        print(f"psutil error while checking processes: {e}")
+
+                # If no hyperopt processes are running and no JSON file, assume completion
+                if (
+                    not hyperopt_running
+                    and (time.time() - start_time) > MIN_WAIT_BEFORE_PROCESS_CHECK
+                ):  # Give at least 60 seconds before checking
+                    print("Hyperopt process completed but no strategy JSON was generated")
+                    raise RuntimeError("Hyperopt completed but produced no strategy JSON file")
+        finally:
+            if inot is not None:
+                inot.close()
+
+    @staticmethod
+    def _wait_for_write_settle(path: Path, timeout: float = 30.0) -> None:
+        """
+        Wait until the file's size stops changing between polls. Guards
+        completion detected by existence polling, where the writer may
+        still hold the file open; close events need no such guard.
+        """
+
+        deadline = time.time() + timeout
+        last_size = -1
+        while time.time() < deadline:
             try:
-                for proc in psutil.process_iter(["pid", "name", "cmdline"]):
-                    try:
-                        cmdline = " ".join(proc.info["cmdline"] or [])
-                        if "freqtrade" in cmdline and "hyperopt" in cmdline:
-                            hyperopt_running = True
-                            break
-                    except (psutil.NoSuchProcess, psutil.AccessDenied):
-                        continue
-            except Exception as e:
-                # If psutil fails, log the error and continue waiting
-                print(f"psutil error while checking processes: {e}")
-
-            # If no hyperopt processes are running and no JSON file, assume completion
-            if (
-                not hyperopt_running and (time.time() - start_time) > min_wait_before_process_check
-            ):  # Give at least 60 seconds before checking
-                print("Hyperopt process completed but no strategy JSON was generated")
-                raise RuntimeError("Hyperopt completed but produced no strategy JSON file")
-
-            # Show waiting progress
-            time.sleep(check_interval)
+                size = path.stat().st_size
+            except OSError:
+                size = -1
+            if size == last_size and size > 0:
+                return
+            last_size = size
+            time.sleep(POLL_INTERVAL)
+
+    @staticmethod
+    def _scan_log_progress(
+        log_file: Path, log_pos: int, run_best: float, max_epoch: int
+    ) -> tuple[float, int, int]:
+        """
+        Read log lines appended since the last scan, updating the run's
+        best objective and highest completed epoch.
+        """
+
+        try:
+            with log_file.open("r") as f:
+                f.seek(log_pos)
+                for line in f:
+                    progress_match = _RE_EPOCH_PROGRESS.search(line)
+                    if progress_match:
+                        max_epoch = max(max_epoch, int(progress_match.group(1)))
+                        run_best = min(run_best, float(progress_match.group(2)))
+                log_pos = f.tell()
+        except OSError:
+            pass
+
+        return run_best, max_epoch, log_pos
+
+    @staticmethod
+    def _terminate_run(
+        proc: Optional[subprocess.Popen], wrapper_pid: Optional[int], pid_file: Path
+    ) -> None:
+        """
+        Terminate an in-flight hyperopt run and its process tree.
+        """
+
+        if wrapper_pid is None and pid_file.exists():
+            try:
+                wrapper_pid = int(pid_file.read_text().strip())
+            except (OSError, ValueError):
+                wrapper_pid = None
+
+        if wrapper_pid is not None:
+            try:
+                wrapper = psutil.Process(wrapper_pid)
+                for child in wrapper.children(recursive=True):
+                    child.terminate()
+                wrapper.terminate()
+            except psutil.NoSuchProcess:
+                pass
+
+        if proc is not None and proc.poll() is None:
+            proc.terminate()
 
     def handle_hyperopt_failure(self, run_id: int, run_dir: Path, error: Exception) -> None:
         """
@@ -205,7 +433,10 @@ class HyperLoop:
             "error": str(error),
             "error_type": type(error).__name__,
         }
-        failure_file.write_text(json.dumps(failure_data, indent=2))
+        if orjson is not None:
+            failure_file.write_bytes(orjson.dumps(failure_data, option=orjson.OPT_INDENT_2))
+        else:
+            failure_file.write_text(json.dumps(failure_data, indent=2))
 
         # Record in data
         self.data.record_failure(run_id, error)
@@ -242,22 +473,35 @@ class HyperLoop:
         strategy_json, _ = self.clear_old_hyperopt_results(run_dir)
 
         # Build the command for new terminal window
-        cmd = self.build_hyperopt_cmd()
+        cmd = self.build_hyperopt_cmd(run_id)
 
-        # Define log file path for this run
+        # Define log and PID file paths for this run
         log_file = run_dir / "hyperopt.log"
+        pid_file = run_dir / "hyperopt.pid"
 
         # Use TerminalManager for Linux window creation with log capture
         window_cmd = TerminalManager.create_window_command(
-            cmd, str(self.project_root), str(log_file)
+            cmd, self._project_root_str, str(log_file), str(pid_file), headless=self.headless
         )
 
-        # Start hyperopt in new window
-        subprocess.Popen(window_cmd, cwd=str(self.project_root))
+        if window_cmd is None:
+            # Headless: skip the terminal/bash/tee chain and run freqtrade
+            # directly with its output redirected to the log file
+            print("Starting hyperopt headless, logging to hyperopt.log", flush=True)
+            with log_file.open("wb") as log_fd:
+                proc = subprocess.Popen(
+                    cmd,
+                    cwd=self._project_root_str,
+                    stdout=log_fd,
+                    stderr=subprocess.STDOUT,
+                )
+        else:
+            # Start hyperopt in new window
+            proc = subprocess.Popen(window_cmd, cwd=self._project_root_str)
 
         # Wait for hyperopt to complete by monitoring strategy JSON
         try:
-            result = self.wait_for_hyperopt_completion(run_dir, strategy_json)
+            result = self.wait_for_hyperopt_completion(run_dir, strategy_json, proc)
             return result
         except RuntimeError as e:
             print(f"Hyperopt completion error: {e}")
@@ -270,6 +514,10 @@ class HyperLoop:
         Run a single hyperopt run.
         """
 
+        print(f"\n\n{'=' * 60}", flush=True)
+        print(f"Starting run {run_id}/{self.num_runs}", flush=True)
+        print(f"{'=' * 60}", flush=True)
+
         # Variables
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
         run_dir = self.runs_dir / f"run_{run_id:03d}_{timestamp}"
@@ -279,7 +527,13 @@ class HyperLoop:
 
         # Attempt running hyperopt in new window
         try:
-            return self.run_hyperopt_window(run_id, run_dir)
+            result = self.run_hyperopt_window(run_id, run_dir)
+            if result and not (result / "EARLY_STOPPED").exists():
+                # Copy the strategy JSON here in the worker, before the next
+                # run's cleanup can delete it while the main thread is still
+                # busy extracting results; early-stopped runs never wrote one
+                DataHandling.copy_hyperopt_results(self.strat_name, self.strategies_dir, run_dir)
+            return result
         except Exception as e:
             print(f"Run {run_id} failed: {e}")
             # Use better error recovery
@@ -298,54 +552,73 @@ class HyperLoop:
         print(f"{'=' * 60}", flush=True)
 
         successful_runs = 0
-
-        # The Loop
-        for i in range(1, self.num_runs + 1):
-            # Print progress bar
-            DisplayData.progress_bar(i, self.num_runs)
-
-            print(f"\n\n{'=' * 60}", flush=True)
-            print(f"Starting run {i}/{self.num_runs}", flush=True)
-            print(f"{'=' * 60}", flush=True)
-
-            # Execute single hyperopt run
-            run_dir = self.run_single(i)
-            if not run_dir:
-                print(f"Run {i} failed to start", flush=True)
-                continue
-
-            # Extract results from this run
-            try:
-                result = self.data.extract_data(run_dir)
-                successful_runs += 1
-
-                print(f"\nRun {i} completed successfully", flush=True)
-                print(f"{'-' * 30}\n", flush=True)
-                print(f"Objective   : {result['objective']:.2f}", flush=True)
-                print(f"Total Trades: {result['metrics'].get('total_trades', 'N/A')}", flush=True)
-                print(f"Profit      : {result['profit']:.2f}", flush=True)
-
-                # Update top results using OptimizationState
-                initial_count = len(self.data.get_top_results())
-                self.data.add_result(result, self.top_n)
-                new_count = len(self.data.get_top_results())
-
-                # Add new top result to file
-                if new_count > initial_count:
-                    print(f"\nNew result added to top {new_count}", flush=True)
-                else:
-                    print(f"\nResult not in top {self.top_n}", flush=True)
-
-                # Copy strategy JSON and log file for reference
-                DataHandling.copy_hyperopt_results(self.strat_name, self.strategies_dir, run_dir)
-
-            except RuntimeError as e:
-                print(f"\nRun {i} produced no usable results: {e}", flush=True)
-                (run_dir / "FAILED").write_text(str(e))
+        completed_runs = 0
+
+        # The Loop - submit all runs to a bounded worker pool and collect
+        # results as they finish; each worker blocks on its own hyperopt
+        # subprocess, so MAX_PARALLEL_RUNS hyperopts run concurrently
+        with ThreadPoolExecutor(max_workers=self.max_parallel_runs) as executor:
+            futures = {executor.submit(self.run_single, i): i for i in range(1, self.num_runs + 1)}
+
+            for future in as_completed(futures):
+                i = futures[future]
+                completed_runs += 1
+
+                # Print progress bar
+                DisplayData.progress_bar(completed_runs, self.num_runs)
+
+                # Execute single hyperopt run
+                run_dir = future.result()
+                if not run_dir:
+                    print(f"Run {i} failed to start", flush=True)
+                    continue
+
+                # Early-stopped runs were killed on purpose because they
+                # couldn't crack the top N - not failures, and nothing to
+                # extract
+                early_stop_marker = run_dir / "EARLY_STOPPED"
+                if early_stop_marker.exists():
+                    print(
+                        f"Run {i} early-stopped ({early_stop_marker.read_text().strip()})",
+                        flush=True,
+                    )
+                    continue
+
+                # Extract results from this run
+                try:
+                    result = self.data.extract_data(run_dir)
+                    successful_runs += 1
+
+                    print(f"\nRun {i} completed successfully", flush=True)
+                    print(f"{'-' * 30}\n", flush=True)
+                    print(f"Objective   : {result['objective']:.2f}", flush=True)
+                    print(
+                        f"Total Trades: {result['metrics'].get('total_trades', 'N/A')}", flush=True
+                    )
+                    print(f"Profit      : {result['profit']:.2f}", flush=True)
+
+                    # Update top results using OptimizationState
+                    with self._results_lock:
+                        initial_count = len(self.data.get_top_results())
+                        self.data.add_result(result, self.top_n)
+                        new_count = len(self.data.get_top_results())
+
+                    # Add new top result to file
+                    if new_count > initial_count:
+                        print(f"\nNew result added to top {new_count}", flush=True)
+                    else:
+                        print(f"\nResult not in top {self.top_n}", flush=True)
+
+                except RuntimeError as e:
+                    print(f"\nRun {i} produced no usable results: {e}", flush=True)
+                    (run_dir / "FAILED").write_text(str(e))
 
         # Clear progress line
         print(flush=True)
 
+        # Write any pending results to disk
+        self.data.flush()
+
         # Get final top results from data
         top_results = self.data.get_top_results()
 
@@ -7,8 +7,38 @@
 # ===========================
 
 
+import functools
 import shutil
 
+# Terminal emulators to try, in order of preference, with the arguments
+# that hand them a command to run
+_TERMINALS: dict[str, list[str]] = {
+    "konsole": ["konsole", "-e"],
+    "gnome-terminal": ["gnome-terminal", "--"],
+    "xterm": ["xterm", "-e"],
+}
+
+
+@functools.lru_cache(maxsize=8)
+def _which(name: str) -> "str | None":
+    """
+    Cached shutil.which - PATH contents don't change during a suite.
+    """
+
+    return shutil.which(name)
+
+
+@functools.lru_cache(maxsize=1)
+def _pick_terminal() -> "str | None":
+    """
+    Pick the first available terminal emulator, once per process.
+    """
+
+    for term in _TERMINALS:
+        if _which(term):
+            return term
+    return None
+
 
 class TerminalManager:
     """
@@ -16,17 +46,31 @@ class TerminalManager:
     """
 
     @staticmethod
-    def create_window_command(cmd: list[str], cwd: str, log_file: str) -> list[str]:
+    def create_window_command(
+        cmd: list[str], cwd: str, log_file: str, pid_file: str = "", headless: bool = False
+    ) -> "list[str] | None":
         """
         Create Linux terminal window command that auto-closes when done.
+
+        Returns None in headless mode to signal the caller to launch the
+        command directly with its output redirected to the log file.
         """
 
+        # Headless: no terminal, no bash/tee wrapper - the caller runs the
+        # command itself and owns the log file
+        if headless:
+            return None
+
         # Build the base command with conda activation
         cmd_str = " ".join(cmd)
 
+        # Record the wrapper shell's PID so the waiter can check liveness
+        # with a single targeted lookup instead of scanning all processes
+        pid_step = f'echo $$ > "{pid_file}" && ' if pid_file else ""
+
         # Use simple tee command to capture all output
         base_cmd = (
-            f'cd "{cwd}" && conda activate freqtrade 2>/dev/null || true && '
+            f'{pid_step}cd "{cwd}" && conda activate freqtrade 2>/dev/null || true && '
             f"{cmd_str} 2>&1 | tee {log_file}"
         )
 
@@ -35,18 +79,11 @@ class TerminalManager:
             f'{base_cmd}; echo "Hyperopt completed, closing window in 3 seconds..."; sleep 3; exit'
         )
 
-        # Try common Linux terminals in order of preference
-        terminals = {
-            "konsole": ["konsole", "-e", "bash", "-c", full_cmd],
-            "gnome-terminal": ["gnome-terminal", "--", "bash", "-c", full_cmd],
-            "xterm": ["xterm", "-e", "bash", "-c", full_cmd],
-        }
-
-        for term, window_cmd in terminals.items():
-            # noinspection PyDeprecation
-            if shutil.which(term):
-                print(f"Starting hyperopt in new terminal: {term}", flush=True)
-                return window_cmd
+        # Use the cached terminal choice instead of re-scanning PATH per run
+        term = _pick_terminal()
+        if term is not None:
+            print(f"Starting hyperopt in new terminal: {term}", flush=True)
+            return [*_TERMINALS[term], "bash", "-c", full_cmd]
 
         # Fallback to current terminal
         print("No suitable terminal found, using current terminal", flush=True)
@@ -7,6 +7,8 @@
 # Added logging and log rotation
 # ===========================
 
+import heapq
+import os
 import subprocess
 import sys
 from datetime import datetime
@@ -28,20 +30,28 @@ def cleanup_old_logs(logs_dir: Path, max_files: int) -> None:
     if max_files <= 0:
         return
 
-    # Get all log files sorted by modification time (newest first)
-    log_files = sorted(
-        logs_dir.glob("HyperLog_*.log"), key=lambda i: i.stat().st_mtime, reverse=True
-    )
-
-    # Remove excess files
-    if len(log_files) > max_files:
-        for old_log in log_files[max_files:]:
+    # Get all log files with mtimes from a single directory scan -
+    # DirEntry.stat() reuses the metadata cached during the readdir
+    with os.scandir(logs_dir) as entries:
+        log_files = [
+            (entry.stat().st_mtime, entry.path)
+            for entry in entries
+            if entry.is_file(follow_symlinks=False)
+            and entry.name.startswith("HyperLog_")
+            and entry.name.endswith(".log")
+        ]
+
+    # Select only the oldest excess files - a partial heap selection
+    # instead of sorting the whole directory listing
+    excess = len(log_files) - max_files
+    if excess > 0:
+        for _, old_log in heapq.nsmallest(excess, log_files):
             try:
-                old_log.unlink()
+                os.unlink(old_log)
                 print("Warning: Max log files reached")
-                print(f"Removed: Old log file: {old_log.name}")
+                print(f"Removed: Old log file: {os.path.basename(old_log)}")
             except OSError as e:
-                print(f"Warning: Could not remove old log file {old_log.name}: {e}")
+                print(f"Warning: Could not remove old log file {os.path.basename(old_log)}: {e}")
 
 
 # --------------------------------------------------------------------------------------------------
@@ -75,16 +85,21 @@ if __name__ == "__main__":
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
             cwd=str(Path.cwd()),
-            text=True,
         )
     except (OSError, subprocess.SubprocessError) as e:
         print(f"Error starting HyperLoop process: {e}")
         sys.exit(1)
 
-    # Copy terminal output and write to log file
-    with log_file.open("w") as f:
-        for line in process.stdout:
-            print(line, end="")  # Output to console
-            f.write(line)  # Write to log file
+    # Copy terminal output and write to log file in large binary chunks -
+    # read1 hands over whatever the pipe holds without waiting for a
+    # newline, so the stream isn't shuttled through Python line by line
+    with log_file.open("wb") as f:
+        while True:
+            chunk = process.stdout.read1(65536)
+            if not chunk:
+                break
+            sys.stdout.buffer.write(chunk)  # Output to console
+            sys.stdout.buffer.flush()
+            f.write(chunk)  # Write to log file
 
     process.wait()